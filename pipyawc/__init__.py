@@ -1,10 +1,11 @@
 from .modules import Controller
 from .parser_factory import new_parser
-from .parsing import process_remote, process_stardard
+from .parsing import flush_notifications, process_remote, process_stardard
 
 __all__ = [
     "new_parser",
     "Controller",
+    "flush_notifications",
     "process_remote",
     "process_stardard",
 ]
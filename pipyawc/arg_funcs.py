@@ -1,19 +1,33 @@
 # Default module imports
 import datetime as dt
 import re
-from itertools import pairwise
-from typing import List, Sequence, Tuple, Union
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple, Union
 
 from dateutil.parser import ParserError as DTParserError
 from dateutil.parser import parse as dtparse
 
+from .modules.constants import format_time
 from .modules.services import AdvJob, AdvScheduler
 
 # Constants
-DAYS = ("sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday")
-UNITS = ("seconds", "minutes", "hours", "days", "weeks", "months")
-SINGULAR_UNITS = ("second", "minute", "hour", "day", "week", "month")
-TIME_FMT = "%m/%d/%Y: %H:%M:%S"
+DAYS = frozenset(
+    ("sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday")
+)
+UNITS_LIST = ("seconds", "minutes", "hours", "days", "weeks", "months")
+SINGULAR_UNITS_LIST = ("second", "minute", "hour", "day", "week", "month")
+UNITS = frozenset(UNITS_LIST)
+SINGULAR_UNITS = frozenset(SINGULAR_UNITS_LIST)
+_UNITS_STR = ", ".join(UNITS_LIST)
+_SINGULAR_UNITS_STR = ", ".join(SINGULAR_UNITS_LIST)
+# Units (singular or plural) that map onto dt.timedelta keyword arguments
+_TD_KWARGS = {
+    unit: plural
+    for singular, plural in zip(SINGULAR_UNITS_LIST, UNITS_LIST)
+    if plural != "months"  # dt.timedelta has no notion of months
+    for unit in (singular, plural)
+}
+_AT_RE = re.compile(r"^(?:[0-2]\d:)?[0-5]\d:[0-5]\d$")
 
 
 def at(string: str, target: Union[AdvScheduler, AdvJob]) -> AdvJob:
@@ -36,7 +50,7 @@ def at(string: str, target: Union[AdvScheduler, AdvJob]) -> AdvJob:
     ValueError
         [description]
     """
-    if not re.match(r"^([0-2]\d:)?[0-5]\d:[0-5]\d$", string):
+    if not _AT_RE.match(string):
         raise ValueError("Invalid format, must be given as HH:MM or HH:MM:SS.")
 
     if isinstance(target, AdvJob):
@@ -107,22 +121,21 @@ def _process_timespan(terms: Sequence[str]) -> Tuple[int, str]:
     left = terms[0].lower()
     right = terms[1].lower()
 
-    if left.isnumeric():
+    try:
         interval = int(left)
-    else:
+    except ValueError:
         raise ValueError(f"Invalid schedule interval: {left}")
 
     if interval == 1:
-        unit_set = SINGULAR_UNITS
+        unit_set, units_str = SINGULAR_UNITS, _SINGULAR_UNITS_STR
     elif interval > 1:
-        unit_set = UNITS
+        unit_set, units_str = UNITS, _UNITS_STR
     else:
         raise ValueError(f"Time interval must be >= 1, received {interval}")
 
     if right in unit_set:
         unit = right
     else:
-        units_str = ", ".join([i for i in unit_set])
         raise KeyError(
             f"Invalid units for interval, {interval}, please select from: {units_str}"
         )
@@ -178,12 +191,25 @@ def delay_for(terms: List[str], job: AdvJob) -> AdvJob:
     -------
     AdvJob
         [description]
+
+    Raises
+    ------
+    ValueError
+        Raised if the terms are not given as 'interval unit' pairs.
     """
-    td_kwargs = {}
+    if len(terms) % 2:
+        raise ValueError(
+            f"Delay contained {len(terms)} terms, should take form "
+            + "'interval unit [interval unit ...]'"
+        )
 
-    for lterm, rterm in pairwise(terms):
-        interval, unit = _process_timespan([lterm, rterm])
-        td_kwargs[unit] = interval
+    td_kwargs: Dict[str, int] = {}
+    for i in range(0, len(terms), 2):
+        interval, unit = _process_timespan(terms[i : i + 2])
+        kwarg = _TD_KWARGS.get(unit)
+        if kwarg is None:
+            raise ValueError(f"Delays cannot be given in {unit}")
+        td_kwargs[kwarg] = td_kwargs.get(kwarg, 0) + interval
 
     offset = dt.timedelta(**td_kwargs)
 
@@ -193,11 +219,33 @@ def delay_for(terms: List[str], job: AdvJob) -> AdvJob:
     return job
 
 
+@lru_cache(maxsize=128)
+def _fuzzy_parse(string: str, today: dt.date) -> dt.datetime:
+    """Parse a fuzzy timestring, caching the result for the day.
+
+    Missing date fields are filled in from today's date, so today is part of
+    the cache key.
+
+    Parameters
+    ----------
+    string : str
+        A standard or fuzzy timestring
+    today : dt.date
+        Today's date
+
+    Returns
+    -------
+    dt.datetime
+        The parsed datetime
+    """
+    return dtparse(string, fuzzy=True)
+
+
 def delay_until(terms: List[str], job: AdvJob) -> AdvJob:
     fuzzy_dt_str = " ".join(terms)
 
     try:
-        new_dt = dtparse(fuzzy_dt_str, fuzzy=True)
+        new_dt = _fuzzy_parse(fuzzy_dt_str, dt.date.today())
     except DTParserError:
         err = f'The provided delay: "{fuzzy_dt_str}" could not be parsed'
         raise ValueError(err)
@@ -208,8 +256,8 @@ def delay_until(terms: List[str], job: AdvJob) -> AdvJob:
     if job.next_run < new_dt:
         job.next_run = new_dt
     else:
-        ot = job.next_run.strftime(TIME_FMT)
-        nt = new_dt.strftime(TIME_FMT)
+        ot = format_time(job.next_run)
+        nt = format_time(new_dt)
         err = f"The new time {nt} occurs before the current runtime {ot}."
         raise ValueError(err)
 
@@ -3,14 +3,18 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
+LOG_DIR = Path.home() / ".pipyawc" / "logs"
+
 
 class CustomLogger(logging.Logger):
+    _log_dir_created = False
 
     @property
     def log_directory(self) -> Path:
-        log_directory = Path.home() / ".pipyawc" / "logs"
-        log_directory.mkdir(parents=True, exist_ok=True)
-        return log_directory
+        if not CustomLogger._log_dir_created:
+            LOG_DIR.mkdir(parents=True, exist_ok=True)
+            CustomLogger._log_dir_created = True
+        return LOG_DIR
 
     @property
     def log_file(self):
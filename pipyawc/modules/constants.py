@@ -0,0 +1,24 @@
+import datetime as dt
+
+# Format used whenever a date/time is reported back to the user
+TIME_FMT = "%m/%d/%Y: %H:%M:%S"
+
+
+def format_time(time: dt.datetime) -> str:
+    """Format a datetime for reporting back to the user.
+
+    Parameters
+    ----------
+    time : dt.datetime
+        The datetime to format
+
+    Returns
+    -------
+    str
+        The datetime formatted as TIME_FMT would, built from the fields directly
+        rather than going through strftime
+    """
+    return (
+        f"{time.month:02d}/{time.day:02d}/{time.year}: "
+        + f"{time.hour:02d}:{time.minute:02d}:{time.second:02d}"
+    )
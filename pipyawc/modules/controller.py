@@ -1,6 +1,7 @@
 import inspect
 from typing import Dict, List, Optional
 
+from pipyawc.modules.constants import TIME_FMT, format_time
 from pipyawc.modules.logistics import Routine
 from pipyawc.modules.peripherals import (
     Dispenser,
@@ -18,8 +19,6 @@ from pipyawc.modules.services import (  # Control high-lvl logic, schedule, user
 )
 from pipyawc.awclogger import logger
 
-TIME_FMT = "%m/%d/%Y: %H:%M:%S"
-
 
 class Controller:
     """_summary_"""
@@ -27,10 +26,10 @@ class Controller:
     def __init__(
         self,
         messenger: Messenger,
-        routines: Dict[str, Routine] = {},
-        monitor: Monitor = Monitor(),
-        dispenser: Dispenser = Dispenser(),
-        schedule: AdvScheduler = AdvScheduler(),
+        routines: Optional[Dict[str, Routine]] = None,
+        monitor: Optional[Monitor] = None,
+        dispenser: Optional[Dispenser] = None,
+        schedule: Optional[AdvScheduler] = None,
     ):
         """
         Initialize the Controller.
@@ -49,10 +48,10 @@ class Controller:
             The scheduler for routines, by default AdvScheduler()
         """
         self.messenger = messenger
-        self.routines = routines
-        self.monitor = monitor
-        self.dispenser = dispenser
-        self.schedule = schedule
+        self.routines = {} if routines is None else routines
+        self.monitor = Monitor() if monitor is None else monitor
+        self.dispenser = Dispenser() if dispenser is None else dispenser
+        self.schedule = AdvScheduler() if schedule is None else schedule
         self.pending_commands: List[RemoteCommand] = []
 
         check_job = self.schedule.every(self.messenger.check_delay_sec).seconds
@@ -124,36 +123,37 @@ class Controller:
         """
         routine = self.routines[name]
         job_ret = run(routine=routine, dispenser=self.dispenser, monitor=self.monitor)
-        for r in routine.error_reports:
-            self.notify(
-                contacts=routine.error_contacts,
-                notify_type=NotifyType.FAILURE,
-                **r,
-            )
+        reports = list(routine.error_reports)
 
         if isinstance(job_ret, CancelJob):
-            title = f"{routine.name}: Critical Error!"
-            body = (
-                f"A scheduled job ({routine.name}) was canceled due to a critical "
-                + "error!"
+            reports.append(
+                {
+                    "title": f"{routine.name}: Critical Error!",
+                    "body": f"A scheduled job ({routine.name}) was canceled due to "
+                    + "a critical error!",
+                }
             )
-            notice_type = NotifyType.FAILURE
         elif not any(routine.errors):
             title = f"{routine.name}: Complete!"
-            started_at = routine.start_dt.strftime(TIME_FMT)
+            started_at = format_time(routine.start_dt)
             runtime = int(routine.run_time.total_seconds())
             body = (
                 f"A job started at {started_at} finished running in {runtime} seconds!"
             )
-            notice_type = NotifyType.SUCCESS
 
             self.notify(
                 body=body,
                 title=title,
                 contacts=routine.completion_contacts,
-                notify_type=notice_type,
+                notify_type=NotifyType.SUCCESS,
             )
 
+        self.notify_batch(
+            name=routine.name,
+            reports=reports,
+            contacts=routine.error_contacts,
+            notify_type=NotifyType.FAILURE,
+        )
         routine.reset()
 
         return job_ret
@@ -174,38 +174,84 @@ class Controller:
 
         Parameters
         ----------
-        recipients : List[str]
-            A list of recipients for the notification.
+        title : str
+            The title of the notification.
         body : str
             The body of the notification.
-        subject : str, optional
-            The subject of the notification, by default ''.
+        contacts : List[str]
+            A list of contact names to notify.
+        notify_type : NotifyType
+            The type of notification.
 
         Returns
         -------
         CancelJob
             The cancellation job, if applicable.
         """
-        contacts = [c for c in contacts if c in self.messenger.contacts.keys()]
-        if any(contacts):
-            try:
-                self.messenger.notify(
-                    body=body,
-                    title=title,
-                    contacts=contacts,
-                    notify_type=notify_type,
-                )
-            except NotificationFailure:
-                params = inspect.signature(self.notify).parameters
-                kwargs = {k: v for k, v in locals().items() if k in params}
-                try_again = self.schedule.every(1).minute
-                try_again.lowest_priority
-                try_again.run_once = True
-                try_again.tag(f"Notify {contacts}")
-                try_again.do(self.notify, **kwargs)
+        if not contacts:
+            return CancelJob()
+
+        known = self.messenger.contacts
+        contacts = [c for c in contacts if c in known]
+        if not contacts:
+            return CancelJob()
+
+        try:
+            self.messenger.notify(
+                body=body,
+                title=title,
+                contacts=contacts,
+                notify_type=notify_type,
+            )
+        except NotificationFailure:
+            params = inspect.signature(self.notify).parameters
+            kwargs = {k: v for k, v in locals().items() if k in params}
+            try_again = self.schedule.every(1).minute
+            try_again.lowest_priority
+            try_again.run_once = True
+            try_again.tag(f"Notify {contacts}")
+            try_again.do(self.notify, **kwargs)
 
         return CancelJob()
 
+    def notify_batch(
+        self,
+        name: str,
+        reports: List[Dict[str, str]],
+        contacts: List[str],
+        notify_type: NotifyType,
+    ) -> CancelJob:
+        """
+        Send several reports to the same contacts as a single notification.
+
+        Parameters
+        ----------
+        name : str
+            The name of the routine the reports are about, used to title a
+            combined notification.
+        reports : List[Dict[str, str]]
+            The reports to send, each with a "title" and a "body".
+        contacts : List[str]
+            A list of contact names to notify.
+        notify_type : NotifyType
+            The type of notification.
+
+        Returns
+        -------
+        CancelJob
+            The cancellation job, if applicable.
+        """
+        if not reports:
+            return CancelJob()
+        if len(reports) == 1:
+            return self.notify(contacts=contacts, notify_type=notify_type, **reports[0])
+
+        title = f"{name}: {len(reports)} errors"
+        body = "\n\n".join(f"{r['title']}\n{r['body']}" for r in reports)
+        return self.notify(
+            title=title, body=body, contacts=contacts, notify_type=notify_type
+        )
+
     def notify_all(
         self,
         title: str,
@@ -1,12 +1,8 @@
 import datetime as dt
 from typing import Dict, List, Optional, Union
 
-from schedule import CancelJob
-
 from .steps import Step
 
-TIME_FMT = "%m/%d/%Y: %H:%M:%S"
-
 
 class Routine:
     """
@@ -23,7 +19,8 @@ class Routine:
     priority : int
         The priority level of the routine.
     steps : List[Step]
-        The list of steps within the routine.
+        The list of steps within the routine, each step's parent is set to this
+        routine.
     error_contacts : Tuple[str], optional
         List of error contacts for notification, by default [].
     completion_contacts : Tuple[str], optional
@@ -52,6 +49,21 @@ class Routine:
         List of completion contacts for notification.
     """
 
+    __slots__ = (
+        "name",
+        "interval",
+        "unit",
+        "priority",
+        "steps",
+        "error_contacts",
+        "completion_contacts",
+        "error_reports",
+        "errors",
+        "run_times",
+        "start_dt",
+        "stop_dt",
+    )
+
     def __init__(
         self,
         name: str,
@@ -67,6 +79,8 @@ class Routine:
         self.unit = unit
         self.priority = priority
         self.steps = steps
+        for step in steps:
+            step.parent = self
         self.error_contacts = error_contacts if error_contacts is not None else []
         self.completion_contacts = (
             completion_contacts if completion_contacts is not None else []
@@ -1,12 +1,12 @@
 import datetime as dt
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Optional, Tuple
 
 if TYPE_CHECKING:
     from .routines import Routine
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     """
     Represents a step within a routine.
@@ -17,12 +17,12 @@ class Step:
         The name of the step.
     pump : str
         The pump associated with the step.
-    start_states : List[str]
-        The list of start states for the step.
-    end_states : error_checks: Tuple[str]
-        The list of end states for the step.
-    error_checks : List[str]
-        Tuple of error checks for the step.
+    start_states : Tuple[str, ...]
+        The start states for the step, any iterable is frozen to a tuple.
+    end_states : Tuple[str, ...]
+        The end states for the step, any iterable is frozen to a tuple.
+    error_checks : Tuple[str, ...]
+        The error checks for the step, any iterable is frozen to a tuple.
     max_runtime : float
         The maximum allowed runtime for the step.
     parent : Optional[Routine], optional
@@ -57,12 +57,12 @@ class Step:
         The name of the step.
     pump : str
         The pump associated with the step.
-    start_states : List[str]
-        The list of start states for the step.
-    end_states : List[str]
-        The list of end states for the step.
-    error_checks : List[str]
-        Tuple of error checks for the step.
+    start_states : Tuple[str, ...]
+        The start states for the step.
+    end_states : Tuple[str, ...]
+        The end states for the step.
+    error_checks : Tuple[str, ...]
+        The error checks for the step.
     max_runtime : float
         The maximum allowed runtime for the step.
     parent : Optional[Routine]
@@ -83,9 +83,9 @@ class Step:
 
     name: str
     pump: str
-    start_states: List[str]
-    end_states: List[str]
-    error_checks: List[str]
+    start_states: Tuple[str, ...]
+    end_states: Tuple[str, ...]
+    error_checks: Tuple[str, ...]
     max_runtime: float
     parent: Optional["Routine"] = None
     first_run: Optional[dt.datetime] = None
@@ -95,6 +95,15 @@ class Step:
     proceed_on_error: bool = False
     cancel_on_critical_failure: bool = True
 
+    def __post_init__(self):
+        """
+        Freeze the state/check collections (typically YAML lists) to tuples, they
+        are only ever iterated or checked for membership once configured.
+        """
+        self.start_states = tuple(self.start_states)
+        self.end_states = tuple(self.end_states)
+        self.error_checks = tuple(self.error_checks)
+
     def __str__(self) -> str:
         """
         Get a string representation of the step for notifications/error reporting.
@@ -120,7 +129,7 @@ class Step:
         float
             The maximum allowed runtime.
         """
-        return max(self.interval_range())
+        return self.interval_range()[1]
 
     @property
     def min_time(self) -> float:
@@ -132,15 +141,15 @@ class Step:
         float
             The minimum allowed runtime.
         """
-        return min(self.interval_range())
+        return self.interval_range()[0]
 
-    def interval_range(self) -> List[Union[int, float]]:
+    def interval_range(self) -> Tuple[float, float]:
         """
         Get the runtime interval range for the step.
 
         Returns
         -------
-        List[int | float]
-            A list representing the runtime interval range.
+        Tuple[float, float]
+            The (minimum, maximum) runtime interval range.
         """
-        return [0.0, self.max_runtime]
+        return (0.0, self.max_runtime)
@@ -1,6 +1,6 @@
 import time
 from functools import wraps
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from gpiozero import DigitalOutputDevice
 
@@ -43,7 +43,9 @@ class Pump(DigitalOutputDevice):
 
 
 class Dispenser:
-    def __init__(self, bounce_time: float = 0.0, pumps: Dict[str, Pump] = {}):
+    def __init__(
+        self, bounce_time: float = 0.0, pumps: Optional[Dict[str, Pump]] = None
+    ):
         """A factory class and a control interface for processing instances of
         the Step class.
 
@@ -58,7 +60,7 @@ class Dispenser:
             :class: Pump objects, by default {}
         """
         self.bounce_time = bounce_time
-        self.pumps = pumps
+        self.pumps = {} if pumps is None else pumps
 
     def register(self, name: str, pin: int, active_high: bool = True) -> Pump:
         """Instantiates a new :class: Pump object and stores it in the
@@ -113,33 +115,43 @@ class Dispenser:
         Tuple[float, List[Union[bool, Exception]]]
             The time for the run to complete and a list of errors returned.
         """
-        start_time = time.time()
-        self.pumps[step.pump].on()  # Turn pump on...
-        run_time = time.time() - start_time
-        max_time = step.max_time
-        errs: List[Union[bool, Exception]] = [False for _ in step.error_checks]
-
-        # While loop runs until end condition is met or an error state is found
-        while monitor.tank_state not in step.end_states:
-            time.sleep(self.bounce_time)
-
-            for i, check in enumerate(step.error_checks):
-                errs[i] = monitor.check_error(check, decrement=not (errs[i]))
-
-            if any(errs):
-                for e in errs:
-                    if isinstance(e, ErrorSensorTriggered):
-                        if e.remaining_runs <= 0:
-                            break
-
-            run_time = time.time() - start_time
-            if run_time >= max_time:  # PumpTimeoutError if time ran out
-                errs.append(PumpTimeoutError(step.pump, run_time))
-                break
-
-        self.pumps[step.pump].off()  # Shut pump off.
-
-        return (run_time, [e for e in errs if e])
+        pump = self.pumps[step.pump]
+        end_states = step.end_states
+        error_checks = step.error_checks
+        bounce_time = self.bounce_time
+        max_ns = int(step.max_time * 1e9)
+        errs: List[Union[bool, Exception]] = [False] * len(error_checks)
+
+        start_ns = time.monotonic_ns()
+        pump.on()  # Turn pump on...
+        try:
+            elapsed_ns = time.monotonic_ns() - start_ns
+
+            # While loop runs until end condition is met or an error state is found
+            while monitor.tank_state not in end_states:
+                time.sleep(bounce_time)
+
+                critical = False
+                for i, check in enumerate(error_checks):
+                    err = monitor.check_error(check, decrement=not (errs[i]))
+                    errs[i] = err
+                    if (
+                        isinstance(err, ErrorSensorTriggered)
+                        and err.remaining_runs <= 0
+                    ):
+                        critical = True  # No permitted runs left, stop pumping
+                        break
+
+                elapsed_ns = time.monotonic_ns() - start_ns
+                if critical:
+                    break
+                if elapsed_ns >= max_ns:  # PumpTimeoutError if time ran out
+                    errs.append(PumpTimeoutError(step.pump, elapsed_ns / 1e9))
+                    break
+        finally:
+            pump.off()  # Shut pump off.
+
+        return (elapsed_ns / 1e9, [e for e in errs if e])
 
     @wraps(_run_step)
     def run_step(
@@ -1,6 +1,6 @@
 from abc import abstractmethod
 from functools import wraps
-from typing import Dict, List, Union
+from typing import Dict, Iterable, Optional, Tuple, Union
 
 from gpiozero import DigitalInputDevice
 
@@ -10,6 +10,9 @@ from .peripheral_errors import CheckError, ErrorSensorTriggered, SensorInstanceE
 
 
 class Sensor(DigitalInputDevice):
+    # gpiozero devices still carry a __dict__, slots only cover our own attributes
+    __slots__ = ("monitor", "name")
+
     def __init__(self, monitor: "Monitor", name: str, pin: int, **kwargs):
         """A parent class for TankSensor and ErrorSensor to inherit from.
 
@@ -38,13 +41,15 @@ class Sensor(DigitalInputDevice):
 
 
 class TankSensor(Sensor):
+    __slots__ = ("when_submerged", "when_exposed", "_submerged_refs", "_exposed_refs")
+
     def __init__(
         self,
         monitor: "Monitor",
         name: str,
         pin: int,
-        when_submerged: List[str],
-        when_exposed: List[str],
+        when_submerged: Iterable[str],
+        when_exposed: Iterable[str],
     ):
         """A class to represent a standard tank sensor which defines the level
         in the main tank when deciding when to start/end routine steps.
@@ -57,35 +62,51 @@ class TankSensor(Sensor):
             A descriptive name for the sensor
         pin : int
             The broadcom (BCM) pin number for the sensor
-        when_submerged : List[str]
-            A list of tank states to report as True when submerged, otherwise reports
-            False
-        when_exposed : List[str]
-            A list of tank states to report as True when exposed, otherwise reports
-            False
+        when_submerged : Iterable[str]
+            The tank states to report as True when submerged, otherwise reports
+            False. Stored as a tuple.
+        when_exposed : Iterable[str]
+            The tank states to report as True when exposed, otherwise reports
+            False. Stored as a tuple.
         """
         super().__init__(monitor, name, pin)
-        self.when_submerged = when_submerged
-        self.when_exposed = when_exposed
-
-    def _update_state_vals(self, set_true: List[str], set_false: List[str]):
+        self.when_submerged: Tuple[str, ...] = tuple(when_submerged)
+        self.when_exposed: Tuple[str, ...] = tuple(when_exposed)
+
+        # Resolve the monitor's per-state records once, so edge callbacks only
+        # write into them instead of looking each state up again
+        tank_states = self.monitor.tank_states
+        self._submerged_refs: Tuple[Dict[str, bool], ...] = tuple(
+            tank_states.setdefault(s, {}) for s in self.when_submerged
+        )
+        self._exposed_refs: Tuple[Dict[str, bool], ...] = tuple(
+            tank_states.setdefault(s, {}) for s in self.when_exposed
+        )
+
+    def _update_state_vals(
+        self,
+        set_true: Tuple[Dict[str, bool], ...],
+        set_false: Tuple[Dict[str, bool], ...],
+    ):
         """
-        [summary]
+        Writes this sensor's contribution into the monitor's tank state records.
 
         Parameters
         ----------
-        set_true : List[str]
-            A list of tank states to report a True contribution to the monitor, if all
+        set_true : Tuple[Dict[str, bool], ...]
+            The records of the tank states to report a True contribution to, if all
             other sensors report True to the monitor for this state, it will be eligible
             to be considered active.
-        set_false : List[str]
-            A list of tank states to report a False contribution to the monitor,
+        set_false : Tuple[Dict[str, bool], ...]
+            The records of the tank states to report a False contribution to,
             this will always mean that those tank states are not considered active
         """
-        for s in set_true:
-            self.monitor.tank_states[s][self.name] = True
-        for s in set_false:
-            self.monitor.tank_states[s][self.name] = False
+        name = self.name
+        for records in set_true:
+            records[name] = True
+        for records in set_false:
+            records[name] = False
+        self.monitor._refresh_tank_state()
 
     @wraps(_update_state_vals)
     def notify_monitor(self) -> None:
@@ -93,12 +114,14 @@ class TankSensor(Sensor):
         Wraps _update_state_vals()
         """
         if self.value == 1:
-            self._update_state_vals(self.when_submerged, self.when_exposed)
+            self._update_state_vals(self._submerged_refs, self._exposed_refs)
         elif self.value == 0:
-            self._update_state_vals(self.when_exposed, self.when_submerged)
+            self._update_state_vals(self._exposed_refs, self._submerged_refs)
 
 
 class ErrorSensor(Sensor):
+    __slots__ = ("trigger_when", "permitted_runs", "remaining_runs")
+
     def __init__(
         self,
         monitor: "Monitor",
@@ -143,10 +166,10 @@ class ErrorSensor(Sensor):
             'submerged' or 'exposed'
         """
         if state == self.trigger_when:
-            self.monitor.error_checks[self.name] = True
+            self.monitor._set_error_check(self.name, True)
         else:
             self.remaining_runs = self.permitted_runs
-            self.monitor.error_checks[self.name] = False
+            self.monitor._set_error_check(self.name, False)
 
     @wraps(_update_status)
     def notify_monitor(self):
@@ -160,11 +183,20 @@ class ErrorSensor(Sensor):
 
 
 class Monitor:
+    __slots__ = (
+        "sensors",
+        "tank_states",
+        "error_checks",
+        "_tank_state",
+        "_tank_state_ok",
+        "_error_count",
+    )
+
     def __init__(
         self,
-        sensors: Dict[str, Union[TankSensor, ErrorSensor]] = {},
-        tank_states: Dict[str, Dict[str, bool]] = {},
-        error_checks: Dict[str, bool] = {},
+        sensors: Optional[Dict[str, Union[TankSensor, ErrorSensor]]] = None,
+        tank_states: Optional[Dict[str, Dict[str, bool]]] = None,
+        error_checks: Optional[Dict[str, bool]] = None,
     ):
         """
         Objects instantiated by the :class: Monitor are factories which create
@@ -186,9 +218,13 @@ class Monitor:
             associated sensor is actively triggered. The values are interpreted
             indirectly by :meth: check_error. By default, {}
         """
-        self.sensors = sensors
-        self.tank_states = tank_states
-        self.error_checks = error_checks
+        self.sensors = {} if sensors is None else sensors
+        self.tank_states = {} if tank_states is None else tank_states
+        self.error_checks = {} if error_checks is None else error_checks
+        # Sensors push their edges to the monitor, so the derived tank state and
+        # the number of triggered error checks are kept up to date incrementally
+        self._error_count = sum(self.error_checks.values())
+        self._refresh_tank_state()
 
     def register(
         self, sensor_type: str, name: str, pin: int, **kwargs
@@ -221,14 +257,7 @@ class Monitor:
         """
         try:
             if sensor_type == "tank":
-                when_submerged: List[str] = kwargs["when_submerged"]
-                when_exposed: List[str] = kwargs["when_exposed"]
-                state_set = set(when_submerged + when_exposed)
-
-                for state in state_set:
-                    if state not in self.tank_states:
-                        self.tank_states[state] = {}
-
+                # The sensor creates any missing tank state records itself
                 sensor = TankSensor(monitor=self, name=name, pin=pin, **kwargs)
 
             elif sensor_type == "error":
@@ -268,15 +297,42 @@ class Monitor:
             routine, the program (via the Controller/Messenger) will generally notify
             all error contacts for that routine.
         """
-        state_reports = {}
-        for state, records in self.tank_states.items():
-            state_reports[state] = all(records.values())
+        return self._tank_state
 
-        if sum(state_reports.values()) == 1:
-            states = [k for k, v in state_reports.items() if v]
-            return states[0]
+    def _refresh_tank_state(self):
+        """
+        Re-derives the cached :property: tank_state from the tank state records,
+        called by tank sensors whenever they report to the monitor.
+        """
+        active = None
+        for state, records in self.tank_states.items():
+            if all(records.values()):
+                if active is not None:  # More than one active state is invalid
+                    active = None
+                    break
+                active = state
+
+        if active is not None:
+            self._tank_state = active
+            self._tank_state_ok = True
         else:
-            return CheckError()
+            self._tank_state = CheckError()
+            self._tank_state_ok = False
+
+    def _set_error_check(self, name: str, triggered: bool):
+        """
+        Records whether the named error sensor is triggered, keeping count of the
+        number of triggered error checks.
+
+        Parameters
+        ----------
+        name : str
+            A descriptive name for the sensor
+        triggered : bool
+            Whether the sensor is in its triggered state
+        """
+        self._error_count += triggered - self.error_checks.get(name, False)
+        self.error_checks[name] = triggered
 
     def check_error(
         self, name: str, decrement: bool = True
@@ -311,13 +367,11 @@ class Monitor:
             return False
 
     def any_errors(self) -> bool:
-        """_summary_
+        """Whether any error check is triggered or no valid tank state was found.
 
         Returns
         -------
         bool
-            _description_
+            True if the monitor is in an error state
         """
-        in_error = [e for e in self.error_checks.values()]
-        in_error.append(isinstance(self.tank_state, CheckError))
-        return any(in_error)
+        return self._error_count > 0 or not self._tank_state_ok
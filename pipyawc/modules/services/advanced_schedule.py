@@ -1,10 +1,32 @@
 # Default module imports
-import random
+import datetime as dt
+import heapq
+import itertools
 import string
-from typing import Any, List, Optional, Set
+from collections import Counter
+from random import choices
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from schedule import CancelJob, Job, Scheduler
 
+# Characters used to build random job tags
+_TAG_ALPHABET = string.ascii_uppercase + string.digits
+
+# (next_run, priority, insertion sequence, job) -- the sequence number breaks ties
+# so that jobs themselves are never compared
+HeapEntry = Tuple[dt.datetime, int, int, "AdvancedJob"]
+
 
 class AdvancedScheduler(Scheduler):
     def __init__(self) -> None:
@@ -19,6 +41,154 @@ class AdvancedScheduler(Scheduler):
         """
         super().__init__()
         self.jobs: List["AdvancedJob"] = self.jobs  # type: ignore[assignment]
+        # Inverted index of tag -> scheduled jobs carrying that tag
+        self._tag_index: Dict[Hashable, Set["AdvancedJob"]] = {}
+        # Results of get_jobs_from_tags, valid until the index next changes
+        self._tag_query_cache: Dict[FrozenSet[Hashable], List["AdvancedJob"]] = {}
+        # Running tally of scheduled job priorities and their extremes
+        self._priorities: Counter[int] = Counter()
+        self._min_priority: int = 0
+        self._max_priority: int = 0
+        # Min-heap of upcoming runs; superseded entries are skipped when popped
+        self._heap: List[HeapEntry] = []
+        self._heap_seq = itertools.count()
+
+    def _push(self, job: "AdvancedJob") -> None:
+        """Push a scheduled job's current run time onto the run heap, superseding
+        any entry previously pushed for it.
+
+        Parameters
+        ----------
+        job : AdvancedJob
+            A job which has been added to the schedule
+        """
+        if job._next_run is None:
+            job._heap_entry = None
+            return
+
+        entry = (job._next_run, job._priority, next(self._heap_seq), job)
+        job._heap_entry = entry
+        heapq.heappush(self._heap, entry)
+
+        # Drop superseded entries once they outnumber the live ones
+        if len(self._heap) > 2 * len(self.jobs) + 16:
+            self._heap = [e for e in self._heap if e[3]._heap_entry is e]
+            heapq.heapify(self._heap)
+
+    def run_pending(self) -> None:
+        """
+        Run all jobs that are scheduled to run, in order of their next run time and
+        then their priority.
+
+        As with :meth: `Scheduler.run_pending()`, missed runs are not made up for;
+        each due job is run once.
+        """
+        now = dt.datetime.now()
+        heap = self._heap
+        due: List[HeapEntry] = []
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if entry[3]._heap_entry is entry:
+                due.append(entry)
+
+        for i, entry in enumerate(due):
+            job = entry[3]
+            # An earlier job may have cancelled or rescheduled this one
+            if job._heap_entry is not entry:
+                continue
+            try:
+                self._run_job(job)
+            except BaseException:
+                # Leave this and any remaining jobs due, as an unsorted list would
+                for e in due[i:]:
+                    if e[3]._heap_entry is e:
+                        heapq.heappush(self._heap, e)
+                raise
+
+    def _index_tags(self, job: "AdvancedJob", tags: Iterable[Hashable]) -> None:
+        """Add a scheduled job to the index entries for the provided tags.
+
+        Parameters
+        ----------
+        job : AdvancedJob
+            A job which has been added to the schedule
+        tags : Iterable[Hashable]
+            Tags of the job to index
+        """
+        self._tag_query_cache.clear()
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(job)
+
+    def _unindex_job(self, job: "AdvancedJob") -> None:
+        """Remove a job from the index entries of all of its tags.
+
+        Parameters
+        ----------
+        job : AdvancedJob
+            A job which has been removed from the schedule
+        """
+        self._tag_query_cache.clear()
+        for tag in job.tags:
+            indexed = self._tag_index.get(tag)
+            if indexed is not None:
+                indexed.discard(job)
+                if not indexed:
+                    del self._tag_index[tag]
+
+    def _track_priority(self, priority: int) -> None:
+        """Add a scheduled job's priority to the priority tally.
+
+        Parameters
+        ----------
+        priority : int
+            The priority of a job which has been added to the schedule
+        """
+        if not self._priorities:
+            self._min_priority = self._max_priority = priority
+        elif priority < self._min_priority:
+            self._min_priority = priority
+        elif priority > self._max_priority:
+            self._max_priority = priority
+        self._priorities[priority] += 1
+
+    def _untrack_priority(self, priority: int) -> None:
+        """Remove a scheduled job's priority from the priority tally.
+
+        Parameters
+        ----------
+        priority : int
+            The priority of a job which has been removed from the schedule
+        """
+        self._priorities[priority] -= 1
+        if self._priorities[priority] > 0:
+            return
+
+        del self._priorities[priority]
+        if not self._priorities:
+            self._min_priority = self._max_priority = 0
+        elif priority == self._min_priority:
+            self._min_priority = min(self._priorities)
+        elif priority == self._max_priority:
+            self._max_priority = max(self._priorities)
+
+    def get_jobs(self, tag: Optional[Hashable] = None) -> List[Job]:
+        """Gets scheduled jobs marked with the given tag, or all jobs if tag is
+        omitted.
+
+        Parameters
+        ----------
+        tag : Optional[Hashable], optional
+            An identifier used to identify a subset of jobs to retrieve, by default
+            None
+
+        Returns
+        -------
+        List[Job]
+            A list of scheduled jobs
+        """
+        if tag is None:
+            return super().get_jobs()
+        return list(self._tag_index.get(tag, ()))
 
     def get_jobs_from_tags(self, tags: List[str]) -> List["AdvancedJob"]:
         """Get any/all jobs that include all of the provided tags.
@@ -33,14 +203,78 @@ class AdvancedScheduler(Scheduler):
         List[AdvancedJob]
             A list of PJob instances with matching tags
         """
-        jobs: List[Set[AdvancedJob]] = []
+        key = frozenset(tags)
+        cached = self._tag_query_cache.get(key)
+        if cached is None:
+            cached = self._tag_query_cache[key] = self._intersect_tags(key)
+        return list(cached)
+
+    def _intersect_tags(self, tags: FrozenSet[Hashable]) -> List["AdvancedJob"]:
+        """Find the scheduled jobs carrying all of the provided tags.
+
+        Parameters
+        ----------
+        tags : FrozenSet[Hashable]
+            A set of hashable tags
+
+        Returns
+        -------
+        List[AdvancedJob]
+            A list of AdvancedJob instances with matching tags
+        """
+        smallest: Optional[Set[AdvancedJob]] = None
         for tag in tags:
-            _jobs: List[AdvancedJob] = self.get_jobs(tag)  # type: ignore[assignment]
-            jobs.append(set(_jobs))
+            indexed = self._tag_index.get(tag)
+            if not indexed:  # No job carries this tag
+                return []
+            if smallest is None or len(indexed) < len(smallest):
+                smallest = indexed
+
+        if smallest is None:
+            return []
+
+        # Only the jobs sharing the rarest tag can carry all of them
+        return [job for job in smallest if tags <= job.tags]
 
-        job_set = jobs[0].intersection(*jobs[1:])
+    def cancel_job(self, job: Job) -> None:
+        """Delete a scheduled job and drop it from the tag index.
 
-        return list(job_set)
+        Parameters
+        ----------
+        job : Job
+            The job to be unscheduled
+        """
+        super().cancel_job(job)
+        if isinstance(job, AdvancedJob) and job._scheduled:
+            job._scheduled = False
+            job._heap_entry = None
+            self._unindex_job(job)
+            self._untrack_priority(job.priority)
+
+    def clear(self, tag: Optional[Hashable] = None) -> None:
+        """Deletes scheduled jobs marked with the given tag, or all jobs if tag is
+        omitted.
+
+        Parameters
+        ----------
+        tag : Optional[Hashable], optional
+            An identifier used to identify a subset of jobs to delete, by default
+            None
+        """
+        for job in self.get_jobs(tag):
+            job._scheduled = False  # type: ignore[attr-defined]
+            job._heap_entry = None  # type: ignore[attr-defined]
+        super().clear(tag)
+
+        self._tag_index = {}
+        self._tag_query_cache.clear()
+        self._priorities = Counter()
+        self._min_priority = self._max_priority = 0  # An empty schedule's extremes
+        self._heap = [job._heap_entry for job in self.jobs if job._heap_entry]
+        heapq.heapify(self._heap)
+        for job in self.jobs:
+            self._index_tags(job, job.tags)
+            self._track_priority(job.priority)
 
     def every(self, interval: int = 1) -> "AdvancedJob":
         """Schedule a new periodic job.
@@ -61,6 +295,20 @@ class AdvancedScheduler(Scheduler):
 
 
 class AdvancedJob(Job):
+    # Job itself has no __slots__, so instances keep a __dict__ for its attributes;
+    # the attributes added here are stored in slots instead
+    __slots__ = (
+        "_scheduled",
+        "_heap_entry",
+        "_priority",
+        "_tags",
+        "_tag_description",
+        "_next_run",
+        "_sort_key",
+        "scheduler",
+        "run_once",
+    )
+
     def __init__(
         self,
         interval: int,
@@ -98,12 +346,67 @@ class AdvancedJob(Job):
             The priority of the job (lower value -> higher priority),
             by default 0 (max priority)
         """
+        self._scheduled = False  # Whether the job is registered with the scheduler
+        self._heap_entry: Optional[HeapEntry] = None
+        self._priority = priority
+        self._tags: FrozenSet[Hashable] = frozenset()
+        # (inputs, rendered) pair memoized by AdvancedJob.tag_description()
+        self._tag_description: Optional[Tuple[Tuple[Any, ...], str]] = None
         super().__init__(interval, scheduler)
         assert scheduler is not None
         self.scheduler: AdvancedScheduler = scheduler
-        self.priority = priority
         self.run_once = run_once
 
+    @property
+    def priority(self) -> int:
+        """
+        The job's priority, used to break ties between jobs scheduled to run at the
+        same time (lower values run first).
+        """
+        return self._priority
+
+    @priority.setter
+    def priority(self, priority: int) -> None:
+        if self._scheduled:
+            self.scheduler._untrack_priority(self._priority)
+            self.scheduler._track_priority(priority)
+            self._priority = priority
+            self._update_sort_key()
+            self.scheduler._push(self)
+        else:
+            self._priority = priority
+            self._update_sort_key()
+
+    @property
+    def tags(self) -> FrozenSet[Hashable]:
+        """
+        The job's tags. Stored as a frozenset, which is replaced (rather than
+        mutated) as tags are added; use AdvancedJob.tag() to add tags.
+        """
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags: Iterable[Hashable]) -> None:
+        if self._scheduled:
+            self.scheduler._unindex_job(self)
+        self._tags = frozenset(tags)
+        if self._scheduled:
+            self.scheduler._index_tags(self, self._tags)
+
+    @property
+    def next_run(self) -> Optional[dt.datetime]:
+        """
+        The datetime at which the job will next run.
+        """
+        return self._next_run
+
+    @next_run.setter
+    def next_run(self, next_run: Optional[dt.datetime]) -> None:
+        self._next_run = next_run
+        self._update_sort_key()
+        if self._scheduled:
+            self.scheduler._push(self)
+
     @property
     def competing_jobs(self) -> List["AdvancedJob"]:
         """_summary_
@@ -113,8 +416,17 @@ class AdvancedJob(Job):
         _type_
             _description_
         """
-        jobs: List[AdvancedJob] = self.scheduler.jobs  # type: ignore[assignment]
-        return jobs
+        return self.scheduler.jobs
+
+    def _update_sort_key(self) -> None:
+        """
+        Caches the key jobs are ordered by: unscheduled jobs (next_run of None) come
+        last, otherwise jobs are ordered by next_run and then priority.
+        """
+        if self._next_run is None:
+            self._sort_key: Tuple[Any, ...] = (True,)
+        else:
+            self._sort_key = (False, self._next_run, self._priority)
 
     def __lt__(self, other: Job) -> bool:
         """
@@ -123,23 +435,12 @@ class AdvancedJob(Job):
         can be set which is checked in the event that two jobs happen at the
         same time.
         """
-        if (other.next_run is None) and (self.next_run is None):
-            return False
-        elif (other.next_run is None) and (self.next_run is not None):
-            return True
-        elif (other.next_run is not None) and (self.next_run is None):
-            return False
-
-        assert self.next_run is not None
-        assert other.next_run is not None
+        if isinstance(other, AdvancedJob):
+            return self._sort_key < other._sort_key
 
-        if self.next_run != other.next_run:
-            return self.next_run < other.next_run
-        else:
-            if isinstance(other, AdvancedJob):
-                return self.priority < other.priority
-            else:
-                return self.next_run < other.next_run
+        # Plain jobs have no priority, so only compare run times
+        other_key = (True,) if other.next_run is None else (False, other.next_run)
+        return self._sort_key[:2] < other_key
 
     @property
     def highest_priority(self):
@@ -147,8 +448,7 @@ class AdvancedJob(Job):
         Set job to the highest priority among all jobs associated with the
         parent schedule
         """
-        priorities = [j.priority for j in self.competing_jobs]
-        self.priority = min(priorities) - 1
+        self.priority = self.scheduler._min_priority - 1
 
     @property
     def lowest_priority(self):
@@ -156,8 +456,7 @@ class AdvancedJob(Job):
         Set job to the lowest priority among all jobs associated with the
         parent schedule
         """
-        priorities = [j.priority for j in self.competing_jobs]
-        self.priority = max(priorities) + 1
+        self.priority = self.scheduler._max_priority + 1
 
     def random_tag(self, k: int = 5) -> None:
         """
@@ -170,8 +469,70 @@ class AdvancedJob(Job):
         k : int
             [description]
         """
-        t = "".join(random.choices(string.ascii_uppercase + string.digits, k=k))
-        self.tags.add(t)
+        t = "".join(choices(_TAG_ALPHABET, k=k))
+        self.tag(t)
+
+    def tag(self, *tags: Hashable) -> "AdvancedJob":
+        """
+        Tags the job with one or more unique identifiers, keeping the scheduler's
+        tag index current if the job is already scheduled.
+
+        Parameters
+        ----------
+        tags : Hashable
+            A unique list of hashable tags
+
+        Returns
+        -------
+        AdvancedJob
+            The invoked job instance
+        """
+        if not all(isinstance(tag, Hashable) for tag in tags):
+            raise TypeError("Tags must be hashable")
+        self._tags = self._tags.union(tags)
+        if self._scheduled:
+            self.scheduler._index_tags(self, tags)
+        return self
+
+    def do(self, job_func: Callable, *args, **kwargs) -> "AdvancedJob":
+        """
+        Specifies the job_func that should be called every time the job runs and
+        adds the job to the schedule (and its tag index).
+
+        Parameters
+        ----------
+        job_func : Callable
+            The function to be scheduled
+
+        Returns
+        -------
+        AdvancedJob
+            The invoked job instance
+        """
+        super().do(job_func, *args, **kwargs)
+        self._scheduled = True
+        self.scheduler._index_tags(self, self.tags)
+        self.scheduler._track_priority(self._priority)
+        self.scheduler._push(self)
+        return self
+
+    def tag_description(self) -> str:
+        """
+        Describes the job along with its tags, i.e. for reporting ambiguous tag
+        queries back to the user. The rendered string is memoized until the job's
+        tags, interval, unit or function change.
+
+        Returns
+        -------
+        str
+            The job's string representation followed by its tags
+        """
+        key = (self._tags, self.interval, self.unit, self.job_func)
+        cached = self._tag_description
+        if cached is None or cached[0] != key:
+            desc = f"{self}: ({', '.join(map(str, self._tags))})"
+            cached = self._tag_description = (key, desc)
+        return cached[1]
 
     def to_string(self, dt_fmt: Optional[str] = None) -> str:
         """[summary]
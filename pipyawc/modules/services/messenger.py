@@ -1,4 +1,6 @@
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import yaml
 from apprise.common import NotifyType
@@ -6,7 +8,7 @@ from apprise.common import NotifyType
 from pipyawc.awclogger import logger
 
 from .notifier import Notifier
-from .receivers import Receiver, RemoteCommand, ReceiverError
+from .receivers import Receiver, RemoteCommand
 
 
 class NotificationFailure(Exception):
@@ -69,6 +71,52 @@ class Messenger:
         self.receivers = receivers if receivers is not None else []
         self.contacts = {} if contacts is None else contacts
         self.check_delay_sec = int(check_delay_sec)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_size = 0
+        # Notifiers keyed by the sorted addresses they deliver to
+        self._notifier_cache: Dict[Tuple[str, ...], Notifier] = {}
+
+    def _get_notifier(self, addresses: List[str]) -> Notifier:
+        """
+        Returns a notifier for the given addresses, reusing one built previously
+        for the same set of addresses.
+
+        Parameters
+        ----------
+        addresses : List[str]
+            Apprise URLs of the contacts to notify
+
+        Returns
+        -------
+        Notifier
+            A notifier with a server for each address
+        """
+        key = tuple(sorted(addresses))
+        notifier = self._notifier_cache.get(key)
+        if notifier is None:
+            notifier = Notifier(servers=list(key))
+            self._notifier_cache[key] = notifier
+        return notifier
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Returns a thread pool with one worker per receiver, replacing the current
+        pool if receivers have since been registered.
+
+        Returns
+        -------
+        ThreadPoolExecutor
+            A thread pool sized to the current list of receivers
+        """
+        n_receivers = len(self.receivers)
+        if self._executor is None or self._executor_size < n_receivers:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(
+                max_workers=n_receivers, thread_name_prefix="receiver"
+            )
+            self._executor_size = n_receivers
+        return self._executor
 
     def check(self) -> List[RemoteCommand]:
         """
@@ -81,14 +129,33 @@ class Messenger:
         List[RemoteCommand]
             List of messages, which should be valid CLI arguments
         """
-        messages = []
+        if not self.receivers:
+            return []
+        elif len(self.receivers) == 1:
+            results = [self.receivers[0].check()]
+        else:
+            # Poll receivers concurrently; each check is mostly spent waiting on I/O
+            executor = self._get_executor()
+            futures = [executor.submit(r.check) for r in self.receivers]
+            results = [future.result() for future in futures]
+
+        errors = [str(error) for _, error in results if error is not None]
+        if errors:  # Receivers warn about their own failures, once per outage
+            logger.debug(f"{len(errors)} receiver(s) failed: {'; '.join(errors)}")
+
+        return list(chain.from_iterable(commands for commands, _ in results))
+
+    def close(self) -> None:
+        """
+        Closes each receiver's connection and shuts down the receiver thread pool,
+        i.e. when the program exits.
+        """
         for receiver in self.receivers:
-            try:
-                new_messages = receiver.check()
-                messages.extend(new_messages)
-            except ReceiverError:
-                pass
-        return messages
+            receiver.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self._executor_size = 0
 
     def notify(
         self,
@@ -110,25 +177,34 @@ class Messenger:
         contacts : Optional[List[str]], optional
             _description_, by default None
         """
-        contacts = [] if contacts is None else contacts
-        _contacts = [self.contacts[c] for c in contacts]
-        # _contacts = [c for c in _contacts if c.cares_about(notify_type)]
+        if not contacts:
+            return
+
+        # Each address is only notified once, even if listed under several names
+        addresses = list(dict.fromkeys(self.contacts[c].address for c in contacts))
 
-        if contacts:
-            notifier = Notifier(servers=[c.address for c in _contacts])
-            status = notifier.notify(body=body, title=title, notify_type=notify_type)
+        notifier = self._get_notifier(addresses)
+        status = notifier.notify(body=body, title=title, notify_type=notify_type)
 
         if not status:
             logger.warn("Notification delivery failed")
             raise NotificationFailure(f"Notification failed, status: {status}")
-        logger.info(f"Notifications delivered to {len(contacts)}")
+        logger.info(f"Notifications delivered to {len(addresses)}")
 
     def register_contact(self, contact: Contact):
         self.contacts[contact.name] = contact
+        self._notifier_cache.clear()
+
+    def register_contacts(self, contacts: Iterable[Contact]):
+        self.contacts.update((contact.name, contact) for contact in contacts)
+        self._notifier_cache.clear()
 
     def register_receiver(self, receiver: Receiver):
         self.receivers.append(receiver)
 
+    def register_receivers(self, receivers: Iterable[Receiver]):
+        self.receivers.extend(receivers)
+
 
 def contact_constructor(loader: yaml.Loader, node: yaml.MappingNode):
     vals = loader.construct_mapping(node)
@@ -29,4 +29,4 @@ class Notifier(Apprise):
         servers : Optional[List[str]], optional
             _description_, by default None
         """
-        super().__init__(servers=servers, asset=pipyawc_asset, debug=True)
+        super().__init__(servers=servers, asset=pipyawc_asset, debug=False)
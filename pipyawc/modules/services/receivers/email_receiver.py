@@ -1,19 +1,63 @@
 # Default module imports
+import imaplib
+import re
 import shlex
-import socket
 import ssl
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-from imap_tools import AND, ImapToolsError, MailBox
+from imap_tools import AND, OR, ImapToolsError, MailBox
 
 from pipyawc.awclogger import logger
 
 from .accessories import ReceiverError, RemoteCommand
 from .receiver import Receiver
 
+# Errors raised by imap_tools/imaplib or the underlying socket when a mailbox
+# connection fails or goes stale
+IMAP_ERRORS = (ImapToolsError, imaplib.IMAP4.error, OSError)
 
-class ImapError(ImapToolsError, socket.gaierror, ConnectionResetError):
-    pass
+
+@lru_cache(maxsize=None)
+def _ssl_context() -> ssl.SSLContext:
+    """
+    Returns a default SSL context, shared across connections so the CA store is
+    only loaded once (and not at import time).
+
+    Returns
+    -------
+    ssl.SSLContext
+        An SSL context with the default trust settings
+    """
+    return ssl.create_default_context()
+
+
+# Characters that need shlex's quote/escape handling
+_SHLEX_CHARS = frozenset("\"'\\")
+
+
+# The last whitespace character in a string; \s matches what str.isspace() does
+_LAST_WHITESPACE = re.compile(r"\s(?=\S*\Z)")
+
+
+def _split_command(text: str) -> List[str]:
+    """
+    Splits message text into CLI arguments, only using shlex when the text
+    contains quotes or escapes.
+
+    Parameters
+    ----------
+    text : str
+        The message text
+
+    Returns
+    -------
+    List[str]
+        The message text split into arguments
+    """
+    if _SHLEX_CHARS.isdisjoint(text):
+        return text.split()
+    return shlex.split(text)
 
 
 class EmailReceiver(Receiver):
@@ -52,7 +96,7 @@ class EmailReceiver(Receiver):
         imap_domain: str,
         inbox: str = "INBOX",
         imap_port: int = 993,
-        contacts: Dict[str, str] = {},
+        contacts: Optional[Dict[str, str]] = None,
     ):
         """
         Initializes an EmailReceiver object.
@@ -80,13 +124,37 @@ class EmailReceiver(Receiver):
         self.imap_domain = imap_domain
         self.inbox = inbox
         self.imap_port = imap_port
-        self.contacts = contacts
+        self.contacts = {} if contacts is None else contacts
         self._proced_error = False
+        self._mailbox: Optional[MailBox] = None
+
+    @property
+    def contacts(self) -> Dict[str, str]:
+        """
+        Short-form contact names and their corresponding email addresses.
+        """
+        return self._contacts
+
+    @contacts.setter
+    def contacts(self, contacts: Dict[str, str]) -> None:
+        self._contacts = contacts
+        self._contact_addresses = frozenset(contacts.values())
+        # Server-side search for unseen mail from any contact
+        self._unseen_criteria = (
+            AND(OR(from_=sorted(self._contact_addresses)), seen=False)
+            if self._contact_addresses
+            else None
+        )
 
     def segment_text(self, body: str) -> List[str]:
         """
         Segments text into chunks suitable for sending as messages.
 
+        Chunks are at most 160 characters long. Each is split off at the last
+        whitespace character that leaves a chunk of at most 160 characters (the
+        whitespace itself is dropped), or mid-word if there is no whitespace to
+        split on.
+
         Parameters
         ----------
         body : str
@@ -99,76 +167,129 @@ class EmailReceiver(Receiver):
         """
         segments = []
         while len(body) > 160:
-            char = 159
-            found_whitespace = False
-
-            while not found_whitespace:
-                if body[char].isspace() or body[char] == "":
-                    segments.append(body[:char])
-                    char_1 = char + 1
-                    body = body[char_1:]
-                    found_whitespace = True
-                else:
-                    char -= 1
+            # Whitespace at index 160 still leaves a full 160 character chunk
+            match = _LAST_WHITESPACE.search(body, 0, 161)
+            if match is None:  # No whitespace to split on, so split mid-word
+                segments.append(body[:160])
+                body = body[160:]
+            else:
+                cut = match.start()
+                segments.append(body[:cut])
+                body = body[cut + 1 :]
 
         if len(body) > 0:
             segments.append(body)
 
         return segments
 
-    def _check(self) -> List[RemoteCommand]:
+    def _connect(self) -> MailBox:
         """
-        Collects unseen/new messages.
+        Returns the logged in mailbox, connecting first if there is none.
+
+        Returns
+        -------
+        MailBox
+            A mailbox logged in to the configured inbox
+        """
+        if self._mailbox is None:
+            mb_kwargs = {
+                "host": self.imap_domain,
+                "port": self.imap_port,
+                "ssl_context": _ssl_context(),
+            }
+            login_kwargs = {
+                "username": self.email_address,
+                "password": self.password,
+                "initial_folder": self.inbox,
+            }
+            self._mailbox = MailBox(**mb_kwargs).login(**login_kwargs)
+        return self._mailbox
+
+    def close(self) -> None:
+        """
+        Logs out of and drops the persistent mailbox connection, if any.
+        """
+        mailbox, self._mailbox = self._mailbox, None
+        if mailbox is not None:
+            try:
+                mailbox.logout()
+            except IMAP_ERRORS:
+                pass  # The connection is being discarded either way
+
+    def _fetch(self, mailbox: MailBox) -> List[RemoteCommand]:
+        """
+        Collects unseen/new messages from a logged in mailbox. Only called when
+        there are contacts to accept commands from.
+
+        Parameters
+        ----------
+        mailbox : MailBox
+            A mailbox logged in to the configured inbox
 
         Returns
         -------
         List[RemoteCommand]:
             List of remote commands.
         """
-        # Create connection and return new messages
-        mb_kwargs = {
-            "host": self.imap_domain,
-            "port": self.imap_port,
-            "ssl_context": ssl.SSLContext(),
-        }
-        login_kwargs = {
-            "username": self.email_address,
-            "password": self.password,
-            "initial_folder": self.inbox,
-        }
-        with MailBox(**mb_kwargs).login(**login_kwargs) as mailbox:
-            commands = []
-
-            # Collect only unseen mail
-            for msg in mailbox.fetch(AND(seen=False)):
-                if msg.from_ in self.contacts.values():
-                    new_cmd = RemoteCommand(shlex.split(msg.text), msg.from_)
-                    commands.append(new_cmd)
+        commands: List[RemoteCommand] = []
+
+        # Collect only unseen mail from contacts. IMAP's FROM search matches
+        # substrings, so senders are still checked exactly here.
+        for msg in mailbox.fetch(self._unseen_criteria, bulk=True):
+            if msg.from_ in self._contact_addresses:
+                new_cmd = RemoteCommand(_split_command(msg.text), msg.from_)
+                commands.append(new_cmd)
 
         return commands
 
-    def check(self) -> List[RemoteCommand]:
+    def _check(self) -> List[RemoteCommand]:
         """
-        Checks for unseen/new messages and returns them as a list of RemoteCommand objects.
+        Collects unseen/new messages, reusing the connection from the previous
+        check where possible.
 
         Returns
         -------
-        List[RemoteCommand]
-            List of messages, which should be valid CLI arguments
+        List[RemoteCommand]:
+            List of remote commands.
+        """
+        if self._unseen_criteria is None:  # No contacts to accept commands from
+            return []
+
+        reused = self._mailbox is not None
+        try:
+            return self._fetch(self._connect())
+        except IMAP_ERRORS:
+            self.close()
+            if not reused:
+                raise
+
+        # The cached connection went stale (e.g. timed out); retry on a new one
+        try:
+            return self._fetch(self._connect())
+        except IMAP_ERRORS:
+            self.close()
+            raise
 
-        Raises
-        ------
-        ReceiverError
-            If there's an IMAP error.
+    def check(self) -> Tuple[List[RemoteCommand], Optional[ReceiverError]]:
+        """
+        Checks for unseen/new messages and returns them as a list of RemoteCommand
+        objects, along with any error encountered.
+
+        Returns
+        -------
+        Tuple[List[RemoteCommand], Optional[ReceiverError]]
+            List of messages, which should be valid CLI arguments, and a
+            ReceiverError if there was an IMAP error (otherwise None)
         """
         try:
             commands = self._check()
-            if any(commands):
-                logger.info(f"Received {len(commands)} new email commands.")
-            self._proced_error = False
-            return commands
-        except ImapError as e:
+        except IMAP_ERRORS as e:
             if not self._proced_error:
                 logger.warn("Failed to retrieve email.", exc_info=e)
             self._proced_error = True
-            raise ReceiverError(f"IMAP Error ({type(e)})")
+            return [], ReceiverError(f"IMAP Error ({type(e)})")
+
+        if commands:
+            logger.info(f"Received {len(commands)} new email commands.")
+        self._proced_error = False
+        return commands, None
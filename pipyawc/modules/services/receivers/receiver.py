@@ -1,9 +1,9 @@
 from abc import abstractmethod
-from typing import List
+from typing import List, Optional, Tuple
 
 import yaml
 
-from .accessories import RemoteCommand
+from .accessories import ReceiverError, RemoteCommand
 
 
 class Receiver(yaml.YAMLObject):
@@ -25,16 +25,17 @@ class Receiver(yaml.YAMLObject):
         super().__init__()
 
     @abstractmethod
-    def check(self) -> List[RemoteCommand]:
+    def check(self) -> Tuple[List[RemoteCommand], Optional[ReceiverError]]:
         """
         Abstract method to be implemented by subclasses.
         Checks for unseen/new messages and returns them as a list of RemoteCommand
-        objects.
+        objects. Failures to retrieve messages are returned rather than raised.
 
         Returns
         -------
-        List[RemoteCommand]
-            List of messages, which should be valid CLI arguments
+        Tuple[List[RemoteCommand], Optional[ReceiverError]]
+            List of messages, which should be valid CLI arguments, and the error
+            encountered while checking, if any
 
         Raises
         ------
@@ -42,3 +43,9 @@ class Receiver(yaml.YAMLObject):
             Raised if subclasses of this do not implement this method.
         """
         raise NotImplementedError("Receivers must implement a check() method!")
+
+    def close(self) -> None:
+        """
+        Releases any connection kept open between checks. Does nothing unless
+        overridden by a subclass.
+        """
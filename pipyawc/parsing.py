@@ -1,47 +1,117 @@
 # Built-in modules
 from argparse import Namespace
+from collections import defaultdict
 from functools import wraps
-from typing import List, Optional, Tuple
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
 
 from pipyawc.modules import Controller, NotifyType
 from pipyawc.awclogger import logger
 
 
+class _NotifyBuffer:
+    """
+    Collects command notifications so that those going to the same contacts with
+    the same title and type can be sent as a single message.
+    """
+
+    def __init__(self):
+        self._pending: DefaultDict[
+            Tuple[Tuple[str, ...], str, NotifyType], List[str]
+        ] = defaultdict(list)
+
+    def enqueue(
+        self,
+        contacts: List[str],
+        body: str,
+        title: str,
+        notify_type: NotifyType,
+    ):
+        """Queue a notification, dropping bodies already queued under the same key.
+
+        Parameters
+        ----------
+        contacts : List[str]
+            A list of contact names
+        body : str
+            The body of the notification
+        title : str
+            The title of the notification
+        notify_type : NotifyType
+            The type of notification
+        """
+        bodies = self._pending[(tuple(contacts), title, notify_type)]
+        if body not in bodies:
+            bodies.append(body)
+
+    def flush(self, controller: Controller):
+        """Send queued notifications, one per (contacts, title, type).
+
+        Parameters
+        ----------
+        controller : Controller
+            The active controller instance used to send notifications.
+        """
+        pending, self._pending = self._pending, defaultdict(list)
+        for (contacts, title, notify_type), bodies in pending.items():
+            controller.notify(
+                contacts=list(contacts),
+                body="\n---\n".join(bodies),
+                title=title,
+                notify_type=notify_type,
+            )
+
+
+_NOTIFY_BUF = _NotifyBuffer()
+
+
+def flush_notifications(controller: Controller):
+    """Send any notifications queued by process_remote(..., buffered=True).
+
+    Parameters
+    ----------
+    controller : Controller
+        The active controller instance used to send notifications.
+    """
+    _NOTIFY_BUF.flush(controller)
+
+
 def _process_remote(
-    args: Namespace,
+    args: Dict[str, Any],
     controller: Controller,
     output: str = "standard",
     contacts: Optional[List[str]] = None,
+    buffered: bool = False,
 ):
     """[summary]
 
     Parameters
     ----------
-    args : Namespace
-        A Namespace object derived from an ArgumentParser that has already
-        consumed a set arguments using ArgumentParser.parse_args()
+    args : Dict[str, Any]
+        The attributes (i.e. from vars()) of a Namespace object derived from an
+        ArgumentParser that has already consumed a set arguments using
+        ArgumentParser.parse_args()
     controller : Controller
         The active controller instance on which to act.
     output : str, optional
         How to log the results, by default 'standard'
         'remote' = uses the messenger associated with the controller object.
-        'standard' = uses the default print() function
+        'standard' = uses the pipyawc logger
     contacts : Optional[List[str]]; optional
         A list of contact names, by default None
         required if output = 'remote'
+    buffered : bool, optional
+        Whether to queue remote notifications until flush_notifications() is
+        called rather than sending them immediately, by default False
 
     Raises
     ------
     ValueError
-        Raised when output is set to 'remote' but no recipients are passed.
+        Raised when output is set to 'remote' but no contacts are passed.
     """
-    _args = vars(args)
-
-    if _args["_helpstr_"]:
-        ret = (1, _args["returns"])
+    if args["_helpstr_"]:
+        ret = (1, args["returns"])
     else:
-        func = _args["func"]
-        ret = func(_args, controller)
+        ret = args["func"](args, controller)
 
     logger.debug(f"Remote command return: {ret}")
 
@@ -60,7 +130,8 @@ def _process_remote(
                 notify_type = NotifyType.WARNING
 
             if contacts is not None:
-                controller.notify(
+                notify = _NOTIFY_BUF.enqueue if buffered else controller.notify
+                notify(
                     contacts=contacts,
                     body=ret[1],
                     title=title,
@@ -77,12 +148,14 @@ def process_remote(
     controller: Controller,
     output: str = "standard",
     contacts: Optional[List[str]] = None,
+    buffered: bool = False,
 ):
     try:
-        _process_remote(args, controller, output, contacts)
+        _process_remote(vars(args), controller, output, contacts, buffered)
     except Exception as e:
         if output == "remote":
-            controller.notify(
+            notify = _NOTIFY_BUF.enqueue if buffered else controller.notify
+            notify(
                 contacts=contacts if contacts else [],
                 body=f"Something went wrong: {e}",
                 title="Error!",
@@ -107,6 +180,4 @@ def process_stardard(args: Namespace) -> Tuple[Controller, int]:
         [description]
     """
     _args = vars(args)
-    func = _args["func"]
-
-    return func(_args)
+    return _args["func"](_args)
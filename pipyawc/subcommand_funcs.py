@@ -1,4 +1,5 @@
 from argparse import ArgumentError
+from itertools import islice
 from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
@@ -12,10 +13,20 @@ from pipyawc.modules import (
     Routine,
     Step,
 )
+from pipyawc.modules.constants import TIME_FMT, format_time
 
 from .arg_funcs import at, delay_for, delay_until, on, schedule_in
 
-TIME_FMT = "%m/%d/%Y: %H:%M:%S"
+try:  # Prefer the libyaml-backed loader where PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+MAX_REPORTED_JOBS = 10
+# Parsed arguments which describe when a job should run
+SCHEDULE_ARGS = ("routine", "at", "in", "on", "repeat")
+# Step parameters which are set internally and may not come from the config file
+_BANNED_STEP_KEYS = frozenset({"_model"})
 
 
 def _set_at_in(controller: Controller, args: dict, job: Optional[AdvJob]) -> AdvJob:
@@ -28,7 +39,7 @@ def _set_at_in(controller: Controller, args: dict, job: Optional[AdvJob]) -> Adv
         job = schedule_in(args["in"], controller.schedule)
 
     if job is None:
-        arg_str = ", ".join([f"{k} = {v}" for k, v in args.items()])
+        arg_str = ", ".join(f"{k} = {args[k]!r}" for k in SCHEDULE_ARGS if k in args)
         raise ArgumentError(
             argument=None, message=f"Invalid job schedule settings: {arg_str}"
         )
@@ -66,7 +77,7 @@ def run(args: dict, controller: Controller) -> Tuple[bool, str]:
         descriptive message to return to the user.
     """
     routine_name = args["routine"]
-    if not (routine_name in controller.routines.keys()):
+    if routine_name not in controller.routines:
         return (False, f"Invalid routine name: {routine_name}!")
 
     if args["on"]:
@@ -82,17 +93,17 @@ def run(args: dict, controller: Controller) -> Tuple[bool, str]:
         job.tag("Repeating")
     else:
         job.tag("One-Time")
-    job.tag(args["routine"])
+    job.tag(routine_name)
 
-    job.do(controller.run, name=args["routine"])
+    job.do(controller.run, name=routine_name)
 
     return (True, f"New job scheduled!\n{job.to_string(TIME_FMT)}")
 
 
 def __report_multiple_jobs(jobs: List[AdvJob]) -> Tuple[bool, str]:
-    job_descriptions = []
-    for j in jobs:
-        job_descriptions.append(f"{j}: ({', '.join([str(t) for t in j.tags])})")
+    job_descriptions = [j.tag_description() for j in islice(jobs, MAX_REPORTED_JOBS)]
+    if len(jobs) > MAX_REPORTED_JOBS:
+        job_descriptions.append(f"+{len(jobs) - MAX_REPORTED_JOBS} more")
     return (False, f"{len(jobs)} jobs were found: {'; '.join(job_descriptions)}.")
 
 
@@ -121,27 +132,28 @@ def pause(args: dict, controller: Controller) -> Tuple[bool, str]:
         A tuple consisting of the success/failure status (bool) and a
         descriptive message to return to the user.
     """
-    jobs: List[AdvJob] = controller.schedule.get_jobs_from_tags(
-        tags=args["job_tags"]
-    )  # type: ignore[assignment]
+    job_tags = args["job_tags"]
+    jobs: List[AdvJob] = controller.schedule.get_jobs_from_tags(tags=job_tags)
 
-    if len(jobs) > 1:  # More than one job found, report this back.
-        return __report_multiple_jobs(jobs)
-    else:  # One job found, let's proceed
+    if len(jobs) == 1:  # One job found, let's proceed
         job = jobs[0]
 
         try:  # Attempt to use the delay function
-            if "for" in args:
+            if args.get("for"):
                 job = delay_for(args["for"], job)
-            elif "until" in args:
+            elif args.get("until"):
                 job = delay_until(args["until"], job)
         except ValueError as e:  # If an error was raised, return it as a string
             return (False, str(e))
 
-    # Report successful delay
-    assert job.next_run is not None
-    new_time = job.next_run.strftime(TIME_FMT)
-    return (True, f"Job: {job.to_string()} has been delayed until {new_time}.")
+        # Report successful delay
+        assert job.next_run is not None
+        new_time = format_time(job.next_run)
+        return (True, f"Job: {job.to_string()} has been delayed until {new_time}.")
+    elif jobs:  # More than one job found, report this back.
+        return __report_multiple_jobs(jobs)
+    else:
+        return (False, f"No matching jobs for tags: {job_tags}")
 
 
 def cancel(args: dict, controller: Controller) -> Tuple[bool, str]:
@@ -165,18 +177,18 @@ def cancel(args: dict, controller: Controller) -> Tuple[bool, str]:
         A tuple consisting of the success/failure status (bool) and a
         descriptive message to return to the user.
     """
-    job_tags = args["jobtags"]
+    job_tags = args["job_tags"]
     jobs: List[AdvJob] = controller.schedule.get_jobs_from_tags(tags=job_tags)
 
-    if len(jobs) > 1:  # More than one job found, report this back.
-        return __report_multiple_jobs(jobs)
-    elif len(jobs) == 1:  # Only one job, let's proceed
+    if len(jobs) == 1:  # Only one job, let's proceed
         job = jobs[0]
         job_str = job.to_string()
         job.cancel()
         return (True, f"Job: {job_str} cancelled!")
+    elif jobs:  # More than one job found, report this back.
+        return __report_multiple_jobs(jobs)
     else:
-        return (True, f"No matching jobs for tags: {job_tags}")
+        return (False, f"No matching jobs for tags: {job_tags}")
 
 
 def routine(args: dict, controller: Controller) -> Tuple[bool, str]:
@@ -229,6 +241,27 @@ def get_sched(args: dict, controller: Controller) -> Tuple[bool, str]:
     return (True, controller.current_schedule)
 
 
+def _validate_step(step: Dict[str, Any]) -> None:
+    """Checks a step's config for parameters which may not be provided manually.
+
+    Parameters
+    ----------
+    step : Dict[str, Any]
+        The step's parameters as read from the config file
+
+    Raises
+    ------
+    ValueError
+        If any of the step's parameters are set internally.
+    """
+    banned = _BANNED_STEP_KEYS & step.keys()
+    if banned:
+        raise ValueError(
+            f"The {', '.join(map(repr, sorted(banned)))} parameter(s) should not be "
+            + "manually provided for routine steps"
+        )
+
+
 def start(args: dict) -> Tuple[Controller, int]:
     """Instatiates the controller object and returns the # of seconds to pause
     between main() loops
@@ -245,45 +278,43 @@ def start(args: dict) -> Tuple[Controller, int]:
         :class: Controller and the interval between loop runs.)
     """
     for tag, constructor in CONSTRUCTORS.items():
-        yaml.add_constructor(tag, constructor, yaml.SafeLoader)
+        yaml.add_constructor(tag, constructor, SafeLoader)
 
+    # Hand the loader one contiguous buffer instead of letting it stream the file
     with open(args["source"], "rb") as c:
-        config = yaml.load(c, Loader=yaml.SafeLoader)
+        data = c.read()
+    config = yaml.load(data, Loader=SafeLoader)
 
     settings = config["settings"]
 
     messenger = Messenger(check_delay_sec=settings["check_delay_sec"])
     msg_setting: Dict[str, Any] = settings["messenger"]
-    for contact in msg_setting.get("contacts", []):
-        messenger.register_contact(contact)
-    for receiver in msg_setting.get("receivers", []):
-        messenger.register_receiver(receiver)
+    messenger.register_contacts(msg_setting.get("contacts", []))
+    messenger.register_receivers(msg_setting.get("receivers", []))
     dispenser = Dispenser(**settings["dispenser"])
 
     controller = Controller(messenger=messenger, dispenser=dispenser)
 
+    monitor_register = controller.monitor.register
+    dispenser_register = controller.dispenser.register
+    register_routine = controller.register_routine
+
     for es in config["error_sensors"]:
-        controller.monitor.register(sensor_type="error", **es)
+        monitor_register(sensor_type="error", **es)
 
     for ts in config["tank_sensors"]:
-        controller.monitor.register(sensor_type="tank", **ts)
+        monitor_register(sensor_type="tank", **ts)
 
     for p in config["pumps"]:
-        controller.dispenser.register(**p)
+        dispenser_register(**p)
 
     for r in config["routines"]:
-        if any(["_model" in s for s in r["steps"]]):
-            raise ValueError(
-                "The '_model' parameter should not be manually"
-                + "provided for routine steps"
-            )
-
-        r["steps"] = [Step(**s) for s in r["steps"]]
-        routine = Routine(**r)
-
-        for s in routine.steps:
-            s.parent = routine
+        steps = []
+        for s in r["steps"]:
+            _validate_step(s)
+            steps.append(Step(**s))
 
-        controller.register_routine(routine)
+        r["steps"] = steps
+        register_routine(Routine(**r))
 
     return (controller, args["interval"])
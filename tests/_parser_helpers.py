@@ -1,8 +1,9 @@
 import datetime as dt
+import functools
 import json
 import shlex
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from pipyawc import Controller, new_parser, process_remote
 from pipyawc.modules.services import AdvJob, Messenger
@@ -21,20 +22,17 @@ MOCK_CONTROLLER = Controller(
 )
 
 
+@functools.lru_cache(maxsize=None)
 def load_test_commands() -> Dict[str, Dict[str, Dict]]:
-    """Load test commands from a JSON file.
+    """Load test commands from a JSON file, only reading it on the first call.
 
     Returns
     -------
     Dict[str, Dict[str, Dict]]
-        A dictionary containing test command configurations.
+        A dictionary containing test command configurations, shared between
+        callers and not to be modified.
     """
-    configs = {}
-
-    with open(TEST_DIR / "commands.json", "r") as f:
-        configs = json.load(f)
-
-    return configs
+    return json.loads((TEST_DIR / "commands.json").read_bytes())
 
 
 def schedule_mock_routine(add_tags: List[str]) -> AdvJob:
@@ -69,6 +67,27 @@ def reset_controller():
     MOCK_CONTROLLER = Controller(messenger=Messenger(), routines={"Water_Change": None})
 
 
+# Parsers hold no per-call state, so one of each type is shared by every test
+_cached_parser = functools.lru_cache(maxsize=None)(new_parser)
+
+
+@functools.lru_cache(maxsize=None)
+def _split(command: str) -> Tuple[str, ...]:
+    """Tokenize a command string, memoized as the same commands are reused.
+
+    Parameters
+    ----------
+    command : str
+        The command string to tokenize.
+
+    Returns
+    -------
+    Tuple[str, ...]
+        The shell-style tokens of the command.
+    """
+    return tuple(shlex.split(command))
+
+
 def parse_mock_command(command: str, parser_type: str) -> Dict[str, str]:
     """Parse a mock command string.
 
@@ -85,9 +104,9 @@ def parse_mock_command(command: str, parser_type: str) -> Dict[str, str]:
         A dictionary containing the parsed command arguments.
     """
     # Each iteration of this loop tests a valid command string
-    cli = new_parser(parser_type)
-    args = cli.parse_args(shlex.split(command))
-    return {k: v for k, v in vars(args).items()}
+    cli = _cached_parser(parser_type)
+    args = cli.parse_args(_split(command))
+    return dict(vars(args))
 
 
 def process_mock_command(command: str, parser_type="remote"):
@@ -101,8 +120,8 @@ def process_mock_command(command: str, parser_type="remote"):
         The type of parser to use for processing the command (default is "remote").
     """
     # Process mock command
-    remote_cli = new_parser(parser_type)
-    args = remote_cli.parse_args(shlex.split("run Water_Change --at 00:00:00"))
+    remote_cli = _cached_parser(parser_type)
+    args = remote_cli.parse_args(_split("run Water_Change --at 00:00:00"))
     process_remote(args, MOCK_CONTROLLER, output="")
 
 
@@ -160,3 +179,20 @@ def pause(command: str) -> dt.datetime:
     job_time = job.next_run
     assert job_time is not None
     return job_time
+
+
+def call_subcommand(command: str) -> Tuple[bool, str]:
+    """Parse a remote command and call its subcommand on MOCK_CONTROLLER directly.
+
+    Parameters
+    ----------
+    command : str
+        The command string to parse and run.
+
+    Returns
+    -------
+    Tuple[bool, str]
+        The subcommand's success/failure status and message.
+    """
+    args = parse_mock_command(command, "remote")
+    return args["func"](args, MOCK_CONTROLLER)
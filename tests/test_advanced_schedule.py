@@ -0,0 +1,156 @@
+import datetime as dt
+
+from pipyawc.modules.services.advanced_schedule import AdvancedScheduler
+
+
+def _noop():
+    pass
+
+
+def test_get_jobs_from_tags():
+    """
+    A unit test for tag lookups against the scheduler's tag index.
+    """
+    scheduler = AdvancedScheduler()
+    both = scheduler.every(1).minutes.tag("A", "B").do(_noop)
+    only_a = scheduler.every(1).minutes.tag("A").do(_noop)
+
+    assert set(scheduler.get_jobs_from_tags(["A"])) == {both, only_a}
+    assert scheduler.get_jobs_from_tags(["A", "B"]) == [both]
+    assert scheduler.get_jobs_from_tags(["A", "C"]) == []
+    assert scheduler.get_jobs_from_tags([]) == []
+
+    # Tags added after scheduling are indexed as well
+    only_a.tag("C")
+    assert scheduler.get_jobs_from_tags(["A", "C"]) == [only_a]
+
+    scheduler.cancel_job(both)
+    assert scheduler.get_jobs_from_tags(["B"]) == []
+
+    scheduler.clear("C")
+    assert scheduler.get_jobs_from_tags(["A"]) == []
+
+
+def test_priority_extremes():
+    """
+    A unit test for the scheduler's tracked minimum/maximum job priorities.
+    """
+    scheduler = AdvancedScheduler()
+    low = scheduler.every(1).minutes.do(_noop)
+    high = scheduler.every(1).minutes
+    high.highest_priority
+    high.do(_noop)
+    assert high.priority == low.priority - 1
+
+    last = scheduler.every(1).minutes
+    last.lowest_priority
+    last.do(_noop)
+    assert last.priority == low.priority + 1
+
+    scheduler.cancel_job(high)
+    first = scheduler.every(1).minutes
+    first.highest_priority
+    assert first.priority == low.priority - 1
+
+    # Clearing every job resets the extremes to those of an empty schedule
+    scheduler.every(1).minutes.do(_noop).priority = -3
+    scheduler.every(1).minutes.do(_noop).priority = 5
+    scheduler.clear()
+    fresh = scheduler.every(1).minutes
+    fresh.highest_priority
+    assert fresh.priority == -1
+
+
+def test_run_pending_order():
+    """
+    A unit test for running due jobs by next run time and then priority.
+    """
+    scheduler = AdvancedScheduler()
+    ran = []
+    due = dt.datetime.now() - dt.timedelta(seconds=1)
+
+    for name, priority in (("low", 1), ("high", -1), ("cancelled", 0)):
+        job = scheduler.every(1).minutes
+        job.priority = priority
+        job.do(ran.append, name)
+        job.next_run = due
+    scheduler.cancel_job(job)
+
+    later = scheduler.every(1).minutes.do(ran.append, "later")
+    scheduler.run_pending()
+    assert ran == ["high", "low"]
+
+    later.next_run = due
+    scheduler.run_pending()
+    scheduler.run_pending()
+    assert ran == ["high", "low", "later"]
+
+
+def test_tag_query_cache():
+    """
+    A unit test for invalidating cached tag lookups as jobs change.
+    """
+    scheduler = AdvancedScheduler()
+    job = scheduler.every(1).minutes.tag("A").do(_noop)
+    assert isinstance(job.tags, frozenset)
+    assert scheduler.get_jobs_from_tags(["A"]) == [job]
+
+    other = scheduler.every(1).minutes.do(_noop)
+    other.tag("A")
+    assert set(scheduler.get_jobs_from_tags(["A"])) == {job, other}
+
+    other.cancel()
+    assert scheduler.get_jobs_from_tags(["A"]) == [job]
+
+
+def test_get_jobs():
+    """
+    A unit test for single-tag lookups through get_jobs.
+    """
+    scheduler = AdvancedScheduler()
+    job = scheduler.every(1).minutes.tag("A").do(_noop)
+    other = scheduler.every(1).minutes.do(_noop)
+
+    assert scheduler.get_jobs("A") == [job]
+    assert scheduler.get_jobs("B") == []
+    assert scheduler.get_jobs() == [job, other]
+
+
+def test_job_ordering():
+    """
+    A unit test for ordering jobs by next run time and then priority.
+    """
+    scheduler = AdvancedScheduler()
+    now = dt.datetime.now()
+    first, second, third = (scheduler.every(1).minutes for _ in range(3))
+    unscheduled = scheduler.every(1).minutes
+    first.next_run = second.next_run = now
+    third.next_run = now + dt.timedelta(seconds=1)
+    first.priority = -1
+
+    assert sorted([unscheduled, third, second, first]) == [
+        first,
+        second,
+        third,
+        unscheduled,
+    ]
+    assert not unscheduled < unscheduled
+
+
+def test_tag_description():
+    """
+    A unit test for the memoized job/tag description being refreshed on tagging.
+    """
+    scheduler = AdvancedScheduler()
+    job = scheduler.every(1).minutes.do(_noop)
+    job.tags = ["A"]
+
+    assert job.tag_description() == f"{job}: (A)"
+    assert job.tag_description() is job.tag_description()
+
+    job.tag("B")
+    assert job.tag_description().startswith(f"{job}: (")
+    assert set(job.tag_description().split("(")[-1].rstrip(")").split(", ")) == {
+        "A",
+        "B",
+    }
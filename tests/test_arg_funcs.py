@@ -0,0 +1,25 @@
+import datetime as dt
+
+import pytest
+
+from pipyawc.arg_funcs import delay_for
+from pipyawc.modules.services import AdvScheduler
+
+
+def test_delay_for():
+    """
+    A unit test for delaying a job by several 'interval unit' pairs.
+    """
+    job = AdvScheduler().every(1).day.do(print)
+    assert job.next_run is not None
+    next_run = job.next_run
+
+    delay_for(["2", "hours", "30", "minutes"], job)
+    assert job.next_run == next_run + dt.timedelta(hours=2, minutes=30)
+
+    delay_for(["1", "day", "1", "minute", "2", "minutes"], job)
+    assert job.next_run == next_run + dt.timedelta(days=1, hours=2, minutes=33)
+
+    for terms in (["2", "hours", "30"], ["1", "month"]):
+        with pytest.raises(ValueError):
+            delay_for(terms, job)
@@ -0,0 +1,108 @@
+import pytest
+from gpiozero import Device
+from gpiozero.pins.mock import MockFactory
+
+from pipyawc.modules.logistics import Step
+from pipyawc.modules.peripherals import (
+    Dispenser,
+    ErrorSensorTriggered,
+    Monitor,
+    PumpTimeoutError,
+)
+
+PUMP_PIN = 5
+TANK_PIN = 17
+ERROR_PIN = 22
+
+
+@pytest.fixture(autouse=True)
+def mock_pins():
+    """Runs each test against gpiozero's mock pins, starting from fresh pins."""
+    Device.pin_factory = MockFactory()
+    yield Device.pin_factory
+    Device.pin_factory.reset()
+
+
+def _peripherals(permitted_runs: int = 1):
+    """A dispenser with one pump, and a monitor with an 'empty'/'full' tank sensor
+    and a reservoir sensor which is triggered (exposed) from the start."""
+    monitor = Monitor()
+    monitor.register(
+        "tank", "level", TANK_PIN, when_submerged=["full"], when_exposed=["empty"]
+    )
+    monitor.register(
+        "error",
+        "reservoir",
+        ERROR_PIN,
+        trigger_when="exposed",
+        permitted_runs=permitted_runs,
+    )
+    dispenser = Dispenser()
+    pump = dispenser.register("fill", PUMP_PIN)
+    return dispenser, monitor, pump
+
+
+def _step(error_checks, max_runtime: float) -> Step:
+    return Step(
+        name="Fill",
+        pump="fill",
+        start_states=["empty"],
+        end_states=["full"],
+        error_checks=error_checks,
+        max_runtime=max_runtime,
+    )
+
+
+def test_run_step_stops_on_critical_error(monkeypatch):
+    """
+    A unit test for stopping the pump once an error check has no runs left.
+    """
+    dispenser, monitor, pump = _peripherals(permitted_runs=1)
+    check_error = Monitor.check_error
+    pump_states = []
+
+    def recording_check_error(self, name, decrement=True):
+        pump_states.append(pump.is_active)
+        return check_error(self, name, decrement)
+
+    monkeypatch.setattr(Monitor, "check_error", recording_check_error)
+    run_time, errs = dispenser.run_step(_step(["reservoir"], 5.0), monitor)
+
+    assert pump_states == [True]  # Pumping, then stopped after a single check
+    assert not pump.is_active
+    assert run_time < 5.0
+    assert len(errs) == 1
+    assert isinstance(errs[0], ErrorSensorTriggered)
+    assert errs[0].remaining_runs == 0
+
+
+def test_run_step_times_out():
+    """
+    A unit test for reporting a PumpTimeoutError once the step's max runtime passes.
+    """
+    dispenser, monitor, pump = _peripherals()
+    run_time, errs = dispenser.run_step(_step([], 0.05), monitor)
+
+    assert not pump.is_active
+    assert run_time >= 0.05
+    assert len(errs) == 1
+    assert isinstance(errs[0], PumpTimeoutError)
+    assert errs[0].name == "fill"
+
+
+def test_run_step_turns_pump_off_on_exception(monkeypatch, mock_pins):
+    """
+    A unit test for the pump being switched off when checking errors raises.
+    """
+    dispenser, monitor, pump = _peripherals()
+
+    def failing_check_error(self, name, decrement=True):
+        assert pump.is_active
+        raise RuntimeError("Sensor read failed")
+
+    monkeypatch.setattr(Monitor, "check_error", failing_check_error)
+    with pytest.raises(RuntimeError):
+        dispenser.run_step(_step(["reservoir"], 5.0), monitor)
+
+    assert not pump.is_active
+    assert not mock_pins.pin(PUMP_PIN).state
@@ -0,0 +1,158 @@
+from types import SimpleNamespace
+from typing import List, Tuple
+
+from imap_tools import ImapToolsError
+
+from pipyawc.modules.services import Messenger
+from pipyawc.modules.services.receivers import email_receiver
+from pipyawc.modules.services.receivers.email_receiver import EmailReceiver
+
+CONTACT = "contact@example.com"
+
+
+def _receiver() -> EmailReceiver:
+    return EmailReceiver("pipyawc@example.com", "password", "imap.example.com")
+
+
+def test_segment_text():
+    """
+    A unit test for splitting message text on whitespace into 160 char segments.
+    """
+    receiver = _receiver()
+
+    assert receiver.segment_text("") == []
+    assert receiver.segment_text("a" * 160) == ["a" * 160]
+    assert receiver.segment_text("a" * 100 + " " + "b" * 100) == ["a" * 100, "b" * 100]
+    # Any str.isspace() character is a split point, not just spaces
+    assert receiver.segment_text("a" * 100 + "\r" + "b" * 100) == ["a" * 100, "b" * 100]
+    assert receiver.segment_text("a" * 159 + " " + "b") == ["a" * 159, "b"]
+    # Whitespace right after a full 160 character chunk is still a split point
+    assert receiver.segment_text("a" * 160 + " " + "b") == ["a" * 160, "b"]
+    assert receiver.segment_text("a" * 161 + " " + "b") == ["a" * 160, "a b"]
+
+
+def test_segment_text_without_whitespace():
+    """
+    A unit test for splitting text mid-word when it has no whitespace to split on.
+    """
+    receiver = _receiver()
+
+    assert receiver.segment_text("a" * 400) == ["a" * 160, "a" * 160, "a" * 80]
+
+
+class _MockMailBox:
+    def __init__(self, texts: Tuple[str, ...] = (), fail: bool = False):
+        self.texts = texts
+        self.fail = fail
+        self.logged_out = False
+
+    def login(self, **kwargs) -> "_MockMailBox":
+        return self
+
+    def fetch(self, criteria, bulk=False):
+        if self.fail:
+            raise ImapToolsError("Connection went stale")
+        return [SimpleNamespace(from_=CONTACT, text=t) for t in self.texts]
+
+    def logout(self):
+        self.logged_out = True
+
+
+def _connect_to(monkeypatch, *mailboxes: _MockMailBox) -> List[_MockMailBox]:
+    """Makes new connections return the given mailboxes in order, returning the
+    list of mailboxes which have been connected to."""
+    remaining = list(mailboxes)
+    connected: List[_MockMailBox] = []
+
+    def mock_mailbox(**kwargs) -> _MockMailBox:
+        connected.append(remaining.pop(0))
+        return connected[-1]
+
+    monkeypatch.setattr(email_receiver, "MailBox", mock_mailbox)
+    return connected
+
+
+def test_messenger_close_logs_out():
+    """
+    A unit test for closing a Messenger logging out of its receivers' mailboxes.
+    """
+    receiver = _receiver()
+    mailbox = _MockMailBox()
+    receiver._mailbox = mailbox
+
+    Messenger(receivers=[receiver]).close()
+
+    assert mailbox.logged_out
+    assert receiver._mailbox is None
+
+
+def test_check_without_contacts_does_not_connect(monkeypatch):
+    """
+    A unit test for skipping the IMAP login when there are no contacts to check.
+    """
+    receiver = _receiver()
+
+    def fail_connect():
+        raise AssertionError("Connected without any contacts")
+
+    monkeypatch.setattr(receiver, "_connect", fail_connect)
+    assert receiver.check() == ([], None)
+    assert receiver._mailbox is None
+
+
+def test_check_reconnects_stale_connection(monkeypatch):
+    """
+    A unit test for replacing a persistent connection which has gone stale.
+    """
+    receiver = _receiver()
+    receiver.contacts = {"contact": CONTACT}
+    stale = _MockMailBox(fail=True)
+    receiver._mailbox = stale
+    fresh = _MockMailBox(texts=["status"])
+    connected = _connect_to(monkeypatch, fresh)
+
+    commands, error = receiver.check()
+
+    assert error is None
+    assert [(c.command, c.sender) for c in commands] == [(["status"], CONTACT)]
+    assert stale.logged_out
+    assert connected == [fresh]
+    assert receiver._mailbox is fresh and not fresh.logged_out
+
+
+def test_check_reports_failed_reconnect(monkeypatch):
+    """
+    A unit test for reporting an error when the fresh connection fails as well.
+    """
+    receiver = _receiver()
+    receiver.contacts = {"contact": CONTACT}
+    stale = _MockMailBox(fail=True)
+    receiver._mailbox = stale
+    fresh = _MockMailBox(fail=True)
+    connected = _connect_to(monkeypatch, fresh)
+
+    commands, error = receiver.check()
+
+    assert commands == []
+    assert error is not None
+    assert stale.logged_out and fresh.logged_out
+    assert connected == [fresh]  # Only retried once
+    assert receiver._mailbox is None
+
+
+def test_check_does_not_retry_new_connection(monkeypatch):
+    """
+    A unit test for not retrying when a brand new connection fails.
+    """
+    receiver = _receiver()
+    receiver.contacts = {"contact": CONTACT}
+    new = _MockMailBox(fail=True)
+    connected = _connect_to(monkeypatch, new, _MockMailBox())
+
+    commands, error = receiver.check()
+
+    assert commands == []
+    assert error is not None
+    assert connected == [new]
+    assert new.logged_out
+    assert receiver._mailbox is None
@@ -0,0 +1,102 @@
+import pytest
+from gpiozero import Device
+from gpiozero.pins.mock import MockFactory
+
+from pipyawc.modules.peripherals import CheckError, Monitor
+
+LOW_PIN = 17
+HIGH_PIN = 27
+ERROR_PIN = 22
+
+
+@pytest.fixture(autouse=True)
+def mock_pins():
+    """Runs each test against gpiozero's mock pins, starting from fresh pins."""
+    Device.pin_factory = MockFactory()
+    yield Device.pin_factory
+    Device.pin_factory.reset()
+
+
+def test_tank_state_follows_sensor_edges(mock_pins):
+    """
+    A unit test for the cached tank state tracking tank sensor edges.
+    """
+    monitor = Monitor()
+    monitor.register(
+        "tank", "low", LOW_PIN, when_submerged=["mid", "full"], when_exposed=["empty"]
+    )
+    monitor.register(
+        "tank", "high", HIGH_PIN, when_submerged=["full"], when_exposed=["empty", "mid"]
+    )
+    low, high = mock_pins.pin(LOW_PIN), mock_pins.pin(HIGH_PIN)
+
+    assert monitor.tank_state == "empty"
+    low.drive_high()
+    assert monitor.tank_state == "mid"
+    high.drive_high()
+    assert monitor.tank_state == "full"
+    assert not monitor.any_errors()
+
+    high.drive_low()
+    assert monitor.tank_state == "mid"
+    low.drive_low()
+    assert monitor.tank_state == "empty"
+    assert not monitor.any_errors()
+
+
+def test_tank_state_with_two_active_states(mock_pins):
+    """
+    A unit test for two simultaneously active tank states being reported as invalid.
+    """
+    monitor = Monitor()
+    monitor.register(
+        "tank", "low", LOW_PIN, when_submerged=["mid", "full"], when_exposed=["empty"]
+    )
+    low = mock_pins.pin(LOW_PIN)
+    assert monitor.tank_state == "empty"
+
+    low.drive_high()  # Both 'mid' and 'full' are now active
+    assert isinstance(monitor.tank_state, CheckError)
+    assert monitor.any_errors()
+
+    low.drive_low()
+    assert monitor.tank_state == "empty"
+    assert not monitor.any_errors()
+
+
+def test_error_checks_follow_sensor_edges(mock_pins):
+    """
+    A unit test for the triggered error count tracking error sensor edges.
+    """
+    monitor = Monitor()
+    monitor.register(
+        "tank", "low", LOW_PIN, when_submerged=["full"], when_exposed=["empty"]
+    )
+    sensor = monitor.register(
+        "error", "reservoir", ERROR_PIN, trigger_when="exposed", permitted_runs=2
+    )
+    pin = mock_pins.pin(ERROR_PIN)
+
+    # Exposed (low) from the start, so the check is triggered
+    assert monitor.error_checks == {"reservoir": True}
+    assert monitor._error_count == 1
+    assert monitor.any_errors()
+
+    # Reporting the same state again must not count the error twice
+    sensor.notify_monitor()
+    assert monitor._error_count == 1
+
+    monitor.check_error("reservoir")
+    assert sensor.remaining_runs == 1
+
+    for _ in range(2):  # Repeated edges on the same sensor
+        pin.drive_high()
+        assert monitor.error_checks == {"reservoir": False}
+        assert monitor._error_count == 0
+        assert not monitor.any_errors()
+        assert sensor.remaining_runs == 2  # Reset once no longer triggered
+
+        pin.drive_low()
+        assert monitor.error_checks == {"reservoir": True}
+        assert monitor._error_count == 1
+        assert monitor.any_errors()
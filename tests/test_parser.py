@@ -39,9 +39,9 @@ def test_run():
     time = _help.run("run Water-Change --at 00:00:00")
     print(MOCK_CONTROLLER.schedule.jobs)
     # Determine correct timing
-    correct_time = dt.datetime.today()
-    correct_time = correct_time.replace(hour=0, minute=0, second=0, microsecond=0)
-    if dt.datetime.today().strftime("%HH:%MM:%SS") != "00:00:00":
+    now = dt.datetime.now()
+    correct_time = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    if now.strftime("%HH:%MM:%SS") != "00:00:00":
         correct_time = correct_time + dt.timedelta(days=1)
     # Check job
     _help.check_job(time, correct_time)
@@ -60,24 +60,25 @@ def test_pause():
     """
     time = _help.pause('pause Water_Change Repeating --until "tomorrow at 5"')
     # Determine correct timing
-    correct_time = dt.datetime.today() + dt.timedelta(days=1)
+    now = dt.datetime.now()
+    correct_time = now + dt.timedelta(days=1)
     correct_time = correct_time.replace(hour=5, minute=0, second=0, microsecond=0)
     # Check timing
     _help.check_job(time, correct_time)
 
     time = _help.pause("pause Water_Change --until 00:00:00")
     # Determine correct timing
-    correct_time = dt.datetime.today()
-    correct_time = correct_time.replace(hour=0, minute=0, second=0, microsecond=0)
-    if dt.datetime.today().strftime("%HH:%MM:%SS") != "00:00:00":
+    now = dt.datetime.now()
+    correct_time = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    if now.strftime("%HH:%MM:%SS") != "00:00:00":
         correct_time = correct_time + dt.timedelta(days=1)
     # Check timing
     _help.check_job(time, correct_time)
 
     time = _help.pause("pause Water_Change --until friday at 5PM")
     # Determine correct timing
-    today = dt.datetime.today()
-    friday = today + dt.timedelta((4 - today.weekday()) % 7)
+    now = dt.datetime.now()
+    friday = now + dt.timedelta((4 - now.weekday()) % 7)
     correct_time = friday.replace(hour=17, minute=0, second=0, microsecond=0)
     # Check timing
     _help.check_job(time, correct_time)
@@ -87,3 +88,42 @@ def test_pause():
     correct_time = time + dt.timedelta(minutes=10)
     # Check timing
     _help.check_job(time, correct_time)
+
+
+def test_pause_subcommand():
+    """
+    A unit test for the pause subcommand's success and no-match cases.
+    """
+    _help.reset_controller()
+    job = _help.schedule_mock_routine(["Water_Change", "Repeating"])
+
+    # Only --until is given, so --for (parsed as None) must not be used
+    until = dt.datetime.combine(dt.date.today() + dt.timedelta(days=2), dt.time(5))
+    success, msg = _help.call_subcommand(
+        f"pause Water_Change --until {until:%Y-%m-%d %H:%M:%S}"
+    )
+    assert success, msg
+    assert job.next_run == until
+
+    success, msg = _help.call_subcommand("pause Water_Change --for 10 minutes")
+    assert success, msg
+
+    success, msg = _help.call_subcommand("pause Nothing --for 10 minutes")
+    assert not success
+    assert msg.startswith("No matching jobs")
+
+
+def test_cancel():
+    """
+    A unit test for the cancel subcommand's success and no-match cases.
+    """
+    _help.reset_controller()
+    job = _help.schedule_mock_routine(["Water_Change", "Repeating"])
+
+    success, msg = _help.call_subcommand("cancel Water_Change Repeating")
+    assert success, msg
+    assert job not in _help.MOCK_CONTROLLER.jobs
+
+    success, msg = _help.call_subcommand("cancel Water_Change Repeating")
+    assert not success
+    assert msg.startswith("No matching jobs")